@@ -10,7 +10,8 @@ import java.time.LocalDateTime;
     @Index(name = "idx_coverage_class", columnList = "className"),
     @Index(name = "idx_coverage_commit", columnList = "commitSha"),
     @Index(name = "idx_coverage_timestamp", columnList = "timestamp"),
-    @Index(name = "idx_coverage_repository", columnList = "repositoryId")
+    @Index(name = "idx_coverage_repository", columnList = "repositoryId"),
+    @Index(name = "idx_coverage_repo_class_ts", columnList = "repositoryId, className, timestamp DESC")
 })
 @Data
 @NoArgsConstructor
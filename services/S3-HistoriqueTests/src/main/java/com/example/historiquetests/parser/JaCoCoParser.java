@@ -4,22 +4,34 @@ import com.example.historiquetests.model.ClassTestMap;
 import com.example.historiquetests.model.TestCoverage;
 import lombok.extern.slf4j.Slf4j;
 import org.springframework.stereotype.Component;
-import org.w3c.dom.Document;
-import org.w3c.dom.Element;
-import org.w3c.dom.NodeList;
 
-import javax.xml.parsers.DocumentBuilder;
-import javax.xml.parsers.DocumentBuilderFactory;
+import javax.xml.stream.XMLInputFactory;
+import javax.xml.stream.XMLStreamConstants;
+import javax.xml.stream.XMLStreamReader;
 import java.io.InputStream;
 import java.util.ArrayList;
 import java.util.HashMap;
 import java.util.List;
 import java.util.Map;
+import java.util.regex.Pattern;
 
 @Component
 @Slf4j
 public class JaCoCoParser {
 
+    // Numbered anonymous classes (Foo$1) are kept, other nested/synthetic classes are skipped
+    private static final Pattern ANONYMOUS_CLASS = Pattern.compile(".*\\$\\d+$");
+
+    private static final XMLInputFactory XML_INPUT_FACTORY = createInputFactory();
+
+    private static XMLInputFactory createInputFactory() {
+        XMLInputFactory factory = XMLInputFactory.newInstance();
+        // Do not load the report DTD nor resolve external entities
+        factory.setProperty(XMLInputFactory.SUPPORT_DTD, false);
+        factory.setProperty(XMLInputFactory.IS_SUPPORTING_EXTERNAL_ENTITIES, false);
+        return factory;
+    }
+
     /**
      * Parse JaCoCo XML report and extract coverage metrics per class
      */
@@ -28,56 +40,85 @@ public class JaCoCoParser {
     }
     
     /**
-     * Parse JaCoCo XML report and extract coverage metrics per class with repositoryId
+     * Parse JaCoCo XML report and extract coverage metrics per class with repositoryId.
+     * The report is streamed (StAX) so only the class being read is held in memory.
      */
     public List<TestCoverage> parseJaCoCoReport(InputStream xmlStream, String commitSha, String buildId, String branch, String repositoryId) throws Exception {
-        DocumentBuilderFactory factory = DocumentBuilderFactory.newInstance();
-        // Disable DTD loading to avoid external entity resolution issues
-        factory.setFeature("http://apache.org/xml/features/nonvalidating/load-external-dtd", false);
-        factory.setFeature("http://xml.org/sax/features/external-general-entities", false);
-        factory.setFeature("http://xml.org/sax/features/external-parameter-entities", false);
-        factory.setFeature("http://apache.org/xml/features/disallow-doctype-decl", false);
-        DocumentBuilder builder = factory.newDocumentBuilder();
-        Document doc = builder.parse(xmlStream);
-        doc.getDocumentElement().normalize();
-
         List<TestCoverage> coverageList = new ArrayList<>();
+        String repository = repositoryId != null ? repositoryId : "default";
         
-        // Parse packages
-        NodeList packageNodes = doc.getElementsByTagName("package");
-        
-        for (int i = 0; i < packageNodes.getLength(); i++) {
-            Element packageElement = (Element) packageNodes.item(i);
-            String packageName = packageElement.getAttribute("name").replace('/', '.');
+        XMLStreamReader reader = XML_INPUT_FACTORY.createXMLStreamReader(xmlStream);
+        try {
+            String packageName = "";
+            String className = null;
+            String sourceFile = null;
+            Map<String, Counter> counterMap = new HashMap<>();
+            int methodDepth = 0;
             
-            // Parse classes within package
-            NodeList classNodes = packageElement.getElementsByTagName("class");
-            
-            for (int j = 0; j < classNodes.getLength(); j++) {
-                Element classElement = (Element) classNodes.item(j);
-                TestCoverage coverage = parseClass(classElement, packageName, commitSha, buildId, branch, repositoryId);
+            while (reader.hasNext()) {
+                int event = reader.next();
                 
-                if (coverage != null) {
-                    coverageList.add(coverage);
+                if (event == XMLStreamConstants.START_ELEMENT) {
+                    switch (reader.getLocalName()) {
+                        case "package":
+                            packageName = attribute(reader, "name").replace('/', '.').intern();
+                            break;
+                        case "class":
+                            className = attribute(reader, "name").replace('/', '.');
+                            sourceFile = attribute(reader, "sourcefilename");
+                            counterMap = new HashMap<>();
+                            methodDepth = 0;
+                            break;
+                        case "method":
+                            methodDepth++;
+                            break;
+                        case "counter":
+                            // Class-level counters only, method counters are skipped
+                            if (className != null && methodDepth == 0) {
+                                int missed = parseCount(attribute(reader, "missed"));
+                                int covered = parseCount(attribute(reader, "covered"));
+                                counterMap.put(attribute(reader, "type"), new Counter(covered, missed));
+                            }
+                            break;
+                        default:
+                            break;
+                    }
+                } else if (event == XMLStreamConstants.END_ELEMENT) {
+                    switch (reader.getLocalName()) {
+                        case "method":
+                            methodDepth--;
+                            break;
+                        case "class":
+                            TestCoverage coverage = parseClass(className, sourceFile, counterMap, packageName, commitSha, buildId, branch, repository);
+                            if (coverage != null) {
+                                coverageList.add(coverage);
+                            }
+                            className = null;
+                            break;
+                        case "package":
+                            packageName = "";
+                            break;
+                        default:
+                            break;
+                    }
                 }
             }
+        } finally {
+            reader.close();
         }
         
         log.info("Parsed {} classes from JaCoCo report for commit {}", coverageList.size(), commitSha);
         return coverageList;
     }
     
-    private TestCoverage parseClass(Element classElement, String packageName, String commitSha, String buildId, String branch, String repositoryId) {
-        String className = classElement.getAttribute("name").replace('/', '.');
-        String sourceFile = classElement.getAttribute("sourcefilename");
-        
+    private TestCoverage parseClass(String className, String sourceFile, Map<String, Counter> counterMap, String packageName, String commitSha, String buildId, String branch, String repositoryId) {
         // Skip anonymous classes and synthetic classes
-        if (className.contains("$") && !className.matches(".*\\$\\d+$")) {
+        if (className.contains("$") && !ANONYMOUS_CLASS.matcher(className).matches()) {
             return null;
         }
         
         TestCoverage coverage = new TestCoverage();
-        coverage.setRepositoryId(repositoryId != null ? repositoryId : "default");
+        coverage.setRepositoryId(repositoryId);
         coverage.setCommitSha(commitSha);
         coverage.setClassName(className);
         coverage.setPackageName(packageName);
@@ -85,18 +126,6 @@ public class JaCoCoParser {
         coverage.setBuildId(buildId);
         coverage.setBranch(branch);
         
-        // Parse counters
-        NodeList counters = classElement.getElementsByTagName("counter");
-        Map<String, Counter> counterMap = new HashMap<>();
-        
-        for (int i = 0; i < counters.getLength(); i++) {
-            Element counter = (Element) counters.item(i);
-            String type = counter.getAttribute("type");
-            int missed = Integer.parseInt(counter.getAttribute("missed"));
-            int covered = Integer.parseInt(counter.getAttribute("covered"));
-            counterMap.put(type, new Counter(covered, missed));
-        }
-        
         // Extract metrics
         Counter lineCounter = counterMap.get("LINE");
         if (lineCounter != null) {
@@ -129,6 +158,15 @@ public class JaCoCoParser {
         return coverage;
     }
     
+    private static String attribute(XMLStreamReader reader, String name) {
+        String value = reader.getAttributeValue(null, name);
+        return value != null ? value : "";
+    }
+    
+    private static int parseCount(String value) {
+        return value.isEmpty() ? 0 : Integer.parseInt(value);
+    }
+    
     /**
      * Parse JaCoCo test execution data to map tests to classes they cover
      * This requires the jacoco.exec file processed with the report goal
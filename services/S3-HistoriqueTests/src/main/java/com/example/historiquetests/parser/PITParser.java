@@ -4,22 +4,37 @@ import com.example.historiquetests.model.MutationResult;
 import com.example.historiquetests.model.TestCoverage;
 import lombok.extern.slf4j.Slf4j;
 import org.springframework.stereotype.Component;
-import org.w3c.dom.Document;
-import org.w3c.dom.Element;
-import org.w3c.dom.NodeList;
 
-import javax.xml.parsers.DocumentBuilder;
-import javax.xml.parsers.DocumentBuilderFactory;
+import javax.xml.stream.XMLInputFactory;
+import javax.xml.stream.XMLStreamConstants;
+import javax.xml.stream.XMLStreamException;
+import javax.xml.stream.XMLStreamReader;
 import java.io.InputStream;
 import java.util.ArrayList;
 import java.util.HashMap;
 import java.util.List;
 import java.util.Map;
+import java.util.Set;
 
 @Component
 @Slf4j
 public class PITParser {
 
+    // Leaf elements of <mutation> we read; nested ones (indexes, blocks) are skipped
+    private static final Set<String> MUTATION_FIELDS = Set.of(
+            "detected", "status", "mutatedClass", "mutatedMethod",
+            "lineNumber", "mutator", "description", "killingTest");
+
+    private static final XMLInputFactory XML_INPUT_FACTORY = createInputFactory();
+
+    private static XMLInputFactory createInputFactory() {
+        XMLInputFactory factory = XMLInputFactory.newInstance();
+        // Do not load DTDs nor resolve external entities
+        factory.setProperty(XMLInputFactory.SUPPORT_DTD, false);
+        factory.setProperty(XMLInputFactory.IS_SUPPORTING_EXTERNAL_ENTITIES, false);
+        return factory;
+    }
+
     /**
      * Parse PIT (PIT Mutation Testing) XML report
      */
@@ -28,55 +43,80 @@ public class PITParser {
     }
     
     /**
-     * Parse PIT (PIT Mutation Testing) XML report with repositoryId
+     * Parse PIT (PIT Mutation Testing) XML report with repositoryId.
+     * The report is streamed (StAX) so only the mutation being read is held in memory.
      */
     public List<MutationResult> parsePITReport(InputStream xmlStream, String commitSha, String repositoryId) throws Exception {
-        DocumentBuilderFactory factory = DocumentBuilderFactory.newInstance();
-        // Disable DTD loading to avoid external entity resolution issues
-        factory.setFeature("http://apache.org/xml/features/nonvalidating/load-external-dtd", false);
-        factory.setFeature("http://xml.org/sax/features/external-general-entities", false);
-        factory.setFeature("http://xml.org/sax/features/external-parameter-entities", false);
-        factory.setFeature("http://apache.org/xml/features/disallow-doctype-decl", false);
-        DocumentBuilder builder = factory.newDocumentBuilder();
-        Document doc = builder.parse(xmlStream);
-        doc.getDocumentElement().normalize();
-
         List<MutationResult> mutations = new ArrayList<>();
         
         // PIT XML structure: <mutations><mutation>...</mutation></mutations>
-        NodeList mutationNodes = doc.getElementsByTagName("mutation");
-        
-        for (int i = 0; i < mutationNodes.getLength(); i++) {
-            Element mutationElement = (Element) mutationNodes.item(i);
-            MutationResult mutation = parseMutation(mutationElement, commitSha, repositoryId);
-            mutations.add(mutation);
+        XMLStreamReader reader = XML_INPUT_FACTORY.createXMLStreamReader(xmlStream);
+        try {
+            while (reader.hasNext()) {
+                if (reader.next() == XMLStreamConstants.START_ELEMENT && "mutation".equals(reader.getLocalName())) {
+                    mutations.add(parseMutation(readMutationFields(reader), commitSha, repositoryId));
+                }
+            }
+        } finally {
+            reader.close();
         }
         
         log.info("Parsed {} mutations from PIT report for commit {}", mutations.size(), commitSha);
         return mutations;
     }
     
-    private MutationResult parseMutation(Element mutationElement, String commitSha, String repositoryId) {
+    /**
+     * Read the attributes and leaf children of the current <mutation> element,
+     * leaving the reader on its end tag
+     */
+    private Map<String, String> readMutationFields(XMLStreamReader reader) throws XMLStreamException {
+        Map<String, String> fields = new HashMap<>();
+        
+        // PIT writes detected/status as attributes of <mutation>; they take precedence over children
+        for (int i = 0; i < reader.getAttributeCount(); i++) {
+            String value = reader.getAttributeValue(i);
+            if (!value.isEmpty()) {
+                fields.put(reader.getAttributeLocalName(i), value);
+            }
+        }
+        
+        int depth = 1;
+        while (depth > 0) {
+            int event = reader.next();
+            if (event == XMLStreamConstants.START_ELEMENT) {
+                String name = reader.getLocalName();
+                if (depth == 1 && MUTATION_FIELDS.contains(name)) {
+                    // getElementText consumes the element up to its end tag
+                    String text = reader.getElementText();
+                    fields.putIfAbsent(name, text);
+                } else {
+                    depth++;
+                }
+            } else if (event == XMLStreamConstants.END_ELEMENT) {
+                depth--;
+            }
+        }
+        return fields;
+    }
+    
+    private MutationResult parseMutation(Map<String, String> fields, String commitSha, String repositoryId) {
         MutationResult mutation = new MutationResult();
         mutation.setRepositoryId(repositoryId != null ? repositoryId : "default");
         mutation.setCommitSha(commitSha);
         
         // Parse mutation details
-        String detected = getTextContent(mutationElement, "detected");
-        String status = getTextContent(mutationElement, "status");
+        String detected = fields.get("detected");
+        String status = fields.get("status");
         
         // Map PIT status to our enum
         mutation.setStatus(mapPITStatus(status, detected));
         
         // Class and method info
-        String mutatedClass = getTextContent(mutationElement, "mutatedClass");
-        mutation.setClassName(mutatedClass);
-        
-        String mutatedMethod = getTextContent(mutationElement, "mutatedMethod");
-        mutation.setMethodName(mutatedMethod);
+        mutation.setClassName(intern(fields.get("mutatedClass")));
+        mutation.setMethodName(intern(fields.get("mutatedMethod")));
         
         // Line number
-        String lineNumber = getTextContent(mutationElement, "lineNumber");
+        String lineNumber = fields.get("lineNumber");
         if (lineNumber != null && !lineNumber.isEmpty()) {
             try {
                 mutation.setLineNumber(Integer.parseInt(lineNumber));
@@ -86,17 +126,17 @@ public class PITParser {
         }
         
         // Mutator
-        String mutator = getTextContent(mutationElement, "mutator");
-        mutation.setMutator(mutator);
+        mutation.setMutator(intern(fields.get("mutator")));
         
         // Description
-        String description = getTextContent(mutationElement, "description");
-        mutation.setMutationDescription(description);
+        mutation.setMutationDescription(fields.get("description"));
         
-        // Killing test
-        String killingTest = getTextContent(mutationElement, "killingTest");
-        if (killingTest != null && !killingTest.isEmpty() && !"none".equals(killingTest)) {
-            mutation.setKillingTest(killingTest);
+        // Killing test: only killed mutations carry one
+        if (mutation.getStatus() == MutationResult.MutationStatus.KILLED) {
+            String killingTest = fields.get("killingTest");
+            if (killingTest != null && !killingTest.isEmpty() && !"none".equals(killingTest)) {
+                mutation.setKillingTest(killingTest);
+            }
         }
         
         return mutation;
@@ -123,12 +163,12 @@ public class PITParser {
         }
     }
     
-    private String getTextContent(Element parent, String tagName) {
-        NodeList nodes = parent.getElementsByTagName(tagName);
-        if (nodes.getLength() > 0) {
-            return nodes.item(0).getTextContent();
-        }
-        return null;
+    /**
+     * Class, method and mutator names repeat across most mutations of a report,
+     * so share one String instance per distinct value
+     */
+    private static String intern(String value) {
+        return value != null ? value.intern() : null;
     }
     
     /**
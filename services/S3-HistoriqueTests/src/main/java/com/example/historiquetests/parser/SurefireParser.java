@@ -5,6 +5,7 @@ import lombok.extern.slf4j.Slf4j;
 import org.springframework.stereotype.Component;
 import org.w3c.dom.Document;
 import org.w3c.dom.Element;
+import org.w3c.dom.Node;
 import org.w3c.dom.NodeList;
 
 import javax.xml.parsers.DocumentBuilder;
@@ -45,7 +46,7 @@ public class SurefireParser {
             throw new IllegalArgumentException("Invalid Surefire XML: root element should be 'testsuite'");
         }
         
-        String testClass = testsuiteElement.getAttribute("name");
+        String testClass = testsuiteElement.getAttribute("name").intern();
         
         // Parse individual test cases
         NodeList testcases = testsuiteElement.getElementsByTagName("testcase");
@@ -73,6 +74,8 @@ public class SurefireParser {
         String className = testcase.getAttribute("classname");
         if (className == null || className.isEmpty()) {
             className = testClass;
+        } else {
+            className = className.intern();
         }
         
         result.setTestName(testName);
@@ -89,24 +92,39 @@ public class SurefireParser {
             }
         }
         
-        // Determine status
-        NodeList failures = testcase.getElementsByTagName("failure");
-        NodeList errors = testcase.getElementsByTagName("error");
-        NodeList skipped = testcase.getElementsByTagName("skipped");
+        // Determine status from the testcase children in a single pass
+        Element failure = null;
+        Element error = null;
+        Element skip = null;
+        for (Node child = testcase.getFirstChild(); child != null; child = child.getNextSibling()) {
+            if (child.getNodeType() != Node.ELEMENT_NODE) {
+                continue;
+            }
+            switch (child.getNodeName()) {
+                case "failure":
+                    if (failure == null) failure = (Element) child;
+                    break;
+                case "error":
+                    if (error == null) error = (Element) child;
+                    break;
+                case "skipped":
+                    if (skip == null) skip = (Element) child;
+                    break;
+                default:
+                    break;
+            }
+        }
         
-        if (failures.getLength() > 0) {
+        if (failure != null) {
             result.setStatus(TestResult.TestStatus.FAILED);
-            Element failure = (Element) failures.item(0);
             result.setErrorMessage(failure.getAttribute("message"));
             result.setStackTrace(failure.getTextContent());
-        } else if (errors.getLength() > 0) {
+        } else if (error != null) {
             result.setStatus(TestResult.TestStatus.ERROR);
-            Element error = (Element) errors.item(0);
             result.setErrorMessage(error.getAttribute("message"));
             result.setStackTrace(error.getTextContent());
-        } else if (skipped.getLength() > 0) {
+        } else if (skip != null) {
             result.setStatus(TestResult.TestStatus.SKIPPED);
-            Element skip = (Element) skipped.item(0);
             result.setErrorMessage(skip.getAttribute("message"));
         } else {
             result.setStatus(TestResult.TestStatus.PASSED);
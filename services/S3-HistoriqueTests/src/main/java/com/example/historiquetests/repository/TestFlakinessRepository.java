@@ -6,6 +6,7 @@ import org.springframework.data.jpa.repository.Query;
 import org.springframework.data.repository.query.Param;
 import org.springframework.stereotype.Repository;
 
+import java.util.Collection;
 import java.util.List;
 import java.util.Optional;
 
@@ -14,6 +15,8 @@ public interface TestFlakinessRepository extends JpaRepository<TestFlakiness, Lo
     
     Optional<TestFlakiness> findByTestClassAndTestName(String testClass, String testName);
     
+    List<TestFlakiness> findByTestClassIn(Collection<String> testClasses);
+    
     List<TestFlakiness> findByFlakinessScoreGreaterThan(double threshold);
     
     @Query("SELECT tf FROM TestFlakiness tf ORDER BY tf.flakinessScore DESC")
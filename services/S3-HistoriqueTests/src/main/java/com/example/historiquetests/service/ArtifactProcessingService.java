@@ -61,16 +61,16 @@ public class ArtifactProcessingService {
     private void processJaCoCoArtifact(ArtifactEvent event) throws Exception {
         log.info("Processing JaCoCo artifact for commit: {}", event.getCommitSha());
         
-        // Download from MinIO
-        InputStream xmlStream = minioService.download(event.getArtifactUrl());
-        
-        // Parse the report
-        List<TestCoverage> coverages = jacocoParser.parseJaCoCoReport(
-            xmlStream,
-            event.getCommitSha(),
-            event.getBuildId(),
-            event.getBranch()
-        );
+        // Download from MinIO and parse the report
+        List<TestCoverage> coverages;
+        try (InputStream xmlStream = minioService.download(event.getArtifactUrl())) {
+            coverages = jacocoParser.parseJaCoCoReport(
+                xmlStream,
+                event.getCommitSha(),
+                event.getBuildId(),
+                event.getBranch()
+            );
+        }
         
         // Set repositoryId for all coverage records
         coverages.forEach(c -> c.setRepositoryId(event.getRepositoryId()));
@@ -91,16 +91,16 @@ public class ArtifactProcessingService {
     private void processSurefireArtifact(ArtifactEvent event) throws Exception {
         log.info("Processing Surefire artifact for commit: {}", event.getCommitSha());
         
-        // Download from MinIO
-        InputStream xmlStream = minioService.download(event.getArtifactUrl());
-        
-        // Parse the report
-        List<TestResult> results = surefireParser.parseSurefireReport(
-            xmlStream,
-            event.getCommitSha(),
-            event.getBuildId(),
-            event.getBranch()
-        );
+        // Download from MinIO and parse the report
+        List<TestResult> results;
+        try (InputStream xmlStream = minioService.download(event.getArtifactUrl())) {
+            results = surefireParser.parseSurefireReport(
+                xmlStream,
+                event.getCommitSha(),
+                event.getBuildId(),
+                event.getBranch()
+            );
+        }
         
         // Set repositoryId for all test results
         results.forEach(r -> r.setRepositoryId(event.getRepositoryId()));
@@ -118,14 +118,14 @@ public class ArtifactProcessingService {
     private void processPITArtifact(ArtifactEvent event) throws Exception {
         log.info("Processing PIT artifact for commit: {}", event.getCommitSha());
         
-        // Download from MinIO
-        InputStream xmlStream = minioService.download(event.getArtifactUrl());
-        
-        // Parse the report
-        List<MutationResult> mutations = pitParser.parsePITReport(
-            xmlStream,
-            event.getCommitSha()
-        );
+        // Download from MinIO and parse the report
+        List<MutationResult> mutations;
+        try (InputStream xmlStream = minioService.download(event.getArtifactUrl())) {
+            mutations = pitParser.parsePITReport(
+                xmlStream,
+                event.getCommitSha()
+            );
+        }
         
         // Set repositoryId for all mutations
         mutations.forEach(m -> m.setRepositoryId(event.getRepositoryId()));
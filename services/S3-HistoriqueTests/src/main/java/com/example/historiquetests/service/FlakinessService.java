@@ -7,6 +7,7 @@ import com.example.historiquetests.repository.TestResultRepository;
 import lombok.RequiredArgsConstructor;
 import lombok.extern.slf4j.Slf4j;
 import org.springframework.stereotype.Service;
+import org.springframework.transaction.annotation.Transactional;
 
 import java.time.LocalDateTime;
 import java.util.*;
@@ -19,9 +20,14 @@ public class FlakinessService {
     private final TestFlakinessRepository flakinessRepository;
     private final TestResultRepository testResultRepository;
     
+    // Keeps the IN list of findByTestClassIn well below the JDBC bind parameter limit
+    private static final int TEST_CLASS_BATCH_SIZE = 1000;
+    
     /**
-     * Calculate flakiness for all tests in a given time window
+     * Calculate flakiness for all tests in a given time window.
+     * Transactional so the existing records loaded below stay managed and saveAll does not re-select them.
      */
+    @Transactional
     public List<TestFlakiness> calculateFlakiness(LocalDateTime windowStart, LocalDateTime windowEnd) {
         log.info("Calculating test flakiness from {} to {}", windowStart, windowEnd);
         
@@ -47,15 +53,26 @@ public class FlakinessService {
             flakinessRecords.add(flakiness);
         }
         
+        // Load existing records per batch of test classes instead of one lookup per test
+        Set<String> testClasses = new HashSet<>();
+        for (TestFlakiness flakiness : flakinessRecords) {
+            testClasses.add(flakiness.getTestClass());
+        }
+        Map<String, TestFlakiness> existingByTest = new HashMap<>();
+        List<String> classList = new ArrayList<>(testClasses);
+        for (int from = 0; from < classList.size(); from += TEST_CLASS_BATCH_SIZE) {
+            List<String> batch = classList.subList(from, Math.min(from + TEST_CLASS_BATCH_SIZE, classList.size()));
+            for (TestFlakiness existing : flakinessRepository.findByTestClassIn(batch)) {
+                existingByTest.putIfAbsent(existing.getTestClass() + "#" + existing.getTestName(), existing);
+            }
+        }
+        
         // Save or update flakiness records
+        List<TestFlakiness> toSave = new ArrayList<>(flakinessRecords.size());
         for (TestFlakiness flakiness : flakinessRecords) {
-            Optional<TestFlakiness> existing = flakinessRepository.findByTestClassAndTestName(
-                flakiness.getTestClass(), 
-                flakiness.getTestName()
-            );
+            TestFlakiness existingFlakiness = existingByTest.get(flakiness.getTestClass() + "#" + flakiness.getTestName());
             
-            if (existing.isPresent()) {
-                TestFlakiness existingFlakiness = existing.get();
+            if (existingFlakiness != null) {
                 existingFlakiness.setTotalRuns(flakiness.getTotalRuns());
                 existingFlakiness.setFailedRuns(flakiness.getFailedRuns());
                 existingFlakiness.setPassedRuns(flakiness.getPassedRuns());
@@ -66,11 +83,12 @@ public class FlakinessService {
                 existingFlakiness.setLastFailure(flakiness.getLastFailure());
                 existingFlakiness.setLastSuccess(flakiness.getLastSuccess());
                 existingFlakiness.setCalculatedAt(LocalDateTime.now());
-                flakinessRepository.save(existingFlakiness);
+                toSave.add(existingFlakiness);
             } else {
-                flakinessRepository.save(flakiness);
+                toSave.add(flakiness);
             }
         }
+        flakinessRepository.saveAll(toSave);
         
         log.info("Calculated flakiness for {} tests", flakinessRecords.size());
         return flakinessRecords;
@@ -11,7 +11,6 @@ import org.springframework.stereotype.Service;
 import org.springframework.web.multipart.MultipartFile;
 
 import java.io.InputStream;
-import java.io.ByteArrayInputStream;
 
 @Service
 @Slf4j
@@ -56,7 +55,8 @@ public class MinioService {
     
     /**
      * Download a file from MinIO
-     * Supports both full URLs (s3://minio/bucket/path) and object names
+     * Supports both full URLs (s3://minio/bucket/path) and object names.
+     * The returned stream reads directly from the response and must be closed by the caller.
      */
     public InputStream download(String artifactUrl) throws Exception {
         String objectName = parseObjectName(artifactUrl);
@@ -64,19 +64,13 @@ public class MinioService {
         
         log.info("Downloading from MinIO: bucket={}, object={}", bucketName, objectName);
         
-        InputStream stream = minioClient.getObject(
+        // Streamed to the parsers instead of buffering the whole report in memory
+        return minioClient.getObject(
             GetObjectArgs.builder()
                 .bucket(bucketName)
                 .object(objectName)
                 .build()
         );
-        
-        // Read into byte array to avoid connection issues
-        byte[] content = stream.readAllBytes();
-        stream.close();
-        
-        log.info("Downloaded {} bytes from MinIO: {}", content.length, objectName);
-        return new ByteArrayInputStream(content);
     }
     
     /**
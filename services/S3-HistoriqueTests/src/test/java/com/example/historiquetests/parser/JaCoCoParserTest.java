@@ -0,0 +1,103 @@
+package com.example.historiquetests.parser;
+
+import com.example.historiquetests.model.TestCoverage;
+import org.junit.jupiter.api.Test;
+
+import java.io.ByteArrayInputStream;
+import java.io.InputStream;
+import java.nio.charset.StandardCharsets;
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.util.List;
+
+import static org.junit.jupiter.api.Assertions.assertEquals;
+
+class JaCoCoParserTest {
+
+    private static final Path JACOCO_SAMPLE = Path.of("test-data", "jacoco-sample.xml");
+
+    private final JaCoCoParser parser = new JaCoCoParser();
+
+    private List<TestCoverage> parse(String xml) throws Exception {
+        return parser.parseJaCoCoReport(new ByteArrayInputStream(xml.getBytes(StandardCharsets.UTF_8)),
+                "abc123", "build-1", "main", "repo-1");
+    }
+
+    @Test
+    void parsesSampleReport() throws Exception {
+        List<TestCoverage> coverages;
+        try (InputStream is = Files.newInputStream(JACOCO_SAMPLE)) {
+            coverages = parser.parseJaCoCoReport(is, "abc123", "build-1", "main");
+        }
+
+        assertEquals(3, coverages.size());
+
+        TestCoverage userService = coverages.get(0);
+        assertEquals("com.example.service.UserService", userService.getClassName());
+        assertEquals("com.example.service", userService.getPackageName());
+        assertEquals("UserService.java", userService.getFilePath());
+        assertEquals("default", userService.getRepositoryId());
+        assertEquals(45, userService.getLinesCovered());
+        assertEquals(5, userService.getLinesMissed());
+        assertEquals(90.0, userService.getLineCoverage(), 0.001);
+        assertEquals(8, userService.getBranchesCovered());
+        assertEquals(2, userService.getBranchesMissed());
+        assertEquals(80.0, userService.getBranchCoverage(), 0.001);
+
+        TestCoverage userController = coverages.get(2);
+        assertEquals("com.example.controller.UserController", userController.getClassName());
+        assertEquals("com.example.controller", userController.getPackageName());
+        assertEquals(47, userController.getLinesCovered());
+        assertEquals(19, userController.getBranchesCovered());
+    }
+
+    @Test
+    void keepsClassLevelCountersOnly() throws Exception {
+        List<TestCoverage> coverages = parse(
+                "<?xml version=\"1.0\" encoding=\"UTF-8\"?>"
+                + "<!DOCTYPE report PUBLIC \"-//JACOCO//DTD Report 1.1//EN\" \"report.dtd\">"
+                + "<report name=\"demo\">"
+                + "<sessioninfo id=\"s1\" start=\"1\" dump=\"2\"/>"
+                + "<package name=\"com/example\">"
+                + "<class name=\"com/example/Foo\" sourcefilename=\"Foo.java\">"
+                + "<method name=\"bar\" desc=\"()V\" line=\"3\">"
+                + "<counter type=\"LINE\" missed=\"100\" covered=\"0\"/>"
+                + "<counter type=\"BRANCH\" missed=\"10\" covered=\"0\"/>"
+                + "</method>"
+                + "<counter type=\"LINE\" missed=\"1\" covered=\"3\"/>"
+                + "<counter type=\"BRANCH\" missed=\"2\" covered=\"2\"/>"
+                + "</class>"
+                + "<sourcefile name=\"Foo.java\">"
+                + "<line nr=\"3\" mi=\"0\" ci=\"2\" mb=\"0\" cb=\"0\"/>"
+                + "<counter type=\"LINE\" missed=\"50\" covered=\"50\"/>"
+                + "</sourcefile>"
+                + "<counter type=\"LINE\" missed=\"40\" covered=\"60\"/>"
+                + "</package>"
+                + "<counter type=\"LINE\" missed=\"30\" covered=\"70\"/>"
+                + "</report>");
+
+        assertEquals(1, coverages.size());
+        TestCoverage foo = coverages.get(0);
+        assertEquals("com.example.Foo", foo.getClassName());
+        assertEquals("repo-1", foo.getRepositoryId());
+        assertEquals(3, foo.getLinesCovered());
+        assertEquals(1, foo.getLinesMissed());
+        assertEquals(75.0, foo.getLineCoverage(), 0.001);
+        assertEquals(2, foo.getBranchesCovered());
+        assertEquals(2, foo.getBranchesMissed());
+        assertEquals(0, foo.getMethodsCovered());
+    }
+
+    @Test
+    void skipsNestedClassesButKeepsAnonymousOnes() throws Exception {
+        List<TestCoverage> coverages = parse(
+                "<report name=\"demo\"><package name=\"com/example\">"
+                + "<class name=\"com/example/Foo$Inner\"><counter type=\"LINE\" missed=\"1\" covered=\"1\"/></class>"
+                + "<class name=\"com/example/Foo$1\"><counter type=\"LINE\" missed=\"0\" covered=\"2\"/></class>"
+                + "</package></report>");
+
+        assertEquals(1, coverages.size());
+        assertEquals("com.example.Foo$1", coverages.get(0).getClassName());
+        assertEquals(2, coverages.get(0).getLinesCovered());
+    }
+}
@@ -0,0 +1,107 @@
+package com.example.historiquetests.parser;
+
+import com.example.historiquetests.model.MutationResult;
+import org.junit.jupiter.api.Test;
+
+import java.io.ByteArrayInputStream;
+import java.io.InputStream;
+import java.nio.charset.StandardCharsets;
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.util.List;
+
+import static org.junit.jupiter.api.Assertions.assertEquals;
+import static org.junit.jupiter.api.Assertions.assertNull;
+
+class PITParserTest {
+
+    private static final Path PIT_SAMPLE = Path.of("test-data", "pit-sample.xml");
+
+    private final PITParser parser = new PITParser();
+
+    private List<MutationResult> parseSample() throws Exception {
+        try (InputStream is = Files.newInputStream(PIT_SAMPLE)) {
+            return parser.parsePITReport(is, "abc123", "repo-1");
+        }
+    }
+
+    private List<MutationResult> parse(String xml) throws Exception {
+        return parser.parsePITReport(new ByteArrayInputStream(xml.getBytes(StandardCharsets.UTF_8)), "abc123");
+    }
+
+    @Test
+    void readsStatusFromMutationAttributes() throws Exception {
+        List<MutationResult> mutations = parseSample();
+
+        assertEquals(3, mutations.size());
+        assertEquals(MutationResult.MutationStatus.KILLED, mutations.get(0).getStatus());
+        assertEquals(MutationResult.MutationStatus.SURVIVED, mutations.get(1).getStatus());
+        assertEquals(MutationResult.MutationStatus.KILLED, mutations.get(2).getStatus());
+    }
+
+    @Test
+    void detectedMutationIsKilledWhateverItsStatus() throws Exception {
+        List<MutationResult> mutations = parse(
+                "<mutations><mutation detected=\"true\" status=\"TIMED_OUT\">"
+                + "<mutatedClass>com.example.Foo</mutatedClass>"
+                + "</mutation></mutations>");
+
+        assertEquals(MutationResult.MutationStatus.KILLED, mutations.get(0).getStatus());
+    }
+
+    @Test
+    void fallsBackToChildElementsWhenAttributesAreMissing() throws Exception {
+        List<MutationResult> mutations = parse(
+                "<mutations><mutation>"
+                + "<detected>false</detected><status>NO_COVERAGE</status>"
+                + "<mutatedClass>com.example.Foo</mutatedClass>"
+                + "</mutation></mutations>");
+
+        assertEquals(MutationResult.MutationStatus.NO_COVERAGE, mutations.get(0).getStatus());
+    }
+
+    @Test
+    void parsesSampleMutationDetails() throws Exception {
+        List<MutationResult> mutations = parseSample();
+
+        MutationResult first = mutations.get(0);
+        assertEquals("repo-1", first.getRepositoryId());
+        assertEquals("com.example.service.UserService", first.getClassName());
+        assertEquals("createUser", first.getMethodName());
+        assertEquals(23, first.getLineNumber());
+        assertEquals("org.pitest.mutationtest.engine.gregor.mutators.ReturnValsMutator", first.getMutator());
+        assertEquals("replaced return value with null", first.getMutationDescription());
+        assertEquals("com.example.service.UserServiceTest.testCreateUser", first.getKillingTest());
+
+        // Nested <indexes>/<blocks> must not shift the following fields
+        assertEquals("updateUser", mutations.get(1).getMethodName());
+        assertNull(mutations.get(1).getKillingTest());
+        assertEquals("com.example.service.ProductServiceTest.testCalculatePrice", mutations.get(2).getKillingTest());
+    }
+
+    @Test
+    void ignoresKillingTestOfUndetectedMutation() throws Exception {
+        List<MutationResult> mutations = parse(
+                "<mutations><mutation detected=\"false\" status=\"SURVIVED\">"
+                + "<mutatedClass>com.example.Foo</mutatedClass>"
+                + "<indexes><index>1</index></indexes>"
+                + "<killingTest>com.example.FooTest.test</killingTest>"
+                + "</mutation></mutations>");
+
+        assertEquals(1, mutations.size());
+        assertNull(mutations.get(0).getKillingTest());
+    }
+
+    @Test
+    void keepsKillingTestOfKilledMutationWithoutDetectedField() throws Exception {
+        List<MutationResult> mutations = parse(
+                "<mutations><mutation>"
+                + "<status>KILLED</status>"
+                + "<mutatedClass>com.example.Foo</mutatedClass>"
+                + "<killingTest>com.example.FooTest.test</killingTest>"
+                + "</mutation></mutations>");
+
+        assertEquals(MutationResult.MutationStatus.KILLED, mutations.get(0).getStatus());
+        assertEquals("com.example.FooTest.test", mutations.get(0).getKillingTest());
+    }
+}
@@ -23,9 +23,11 @@ async def health_check():
     return {"status": "ok"}
 
 @app.post("/run-pipeline")
-async def trigger_pipeline():
+def trigger_pipeline():
     """
     Trigger the main data processing pipeline.
+    Declared sync so FastAPI runs the blocking pipeline in its threadpool
+    instead of on the event loop.
     """
     try:
         run_pipeline()
@@ -1,10 +1,19 @@
 """
 Point d'entrée du Service 6 - Moteur de Priorisation
 """
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from src.api import prioritization
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Ouvre le client HTTP partagé vers S5 au démarrage et le ferme à l'arrêt."""
+    await prioritization.ml_client.start()
+    yield
+    await prioritization.ml_client.close()
+
 app = FastAPI(
     title="Moteur de Priorisation API",
     description="""
@@ -20,7 +29,8 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
-    openapi_url="/openapi.json"
+    openapi_url="/openapi.json",
+    lifespan=lifespan
 )
 
 # CORS pour permettre les appels depuis le frontend
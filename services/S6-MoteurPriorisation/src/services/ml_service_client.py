@@ -27,6 +27,25 @@ class MLServiceClient:
         self.base_url = base_url or os.getenv('ML_SERVICE_URL', 'http://localhost:8005')
         self.api_key = os.getenv('ML_SERVICE_API_KEY', '')
         self.timeout = 30.0
+        self._client: Optional[httpx.AsyncClient] = None
+    
+    async def start(self) -> None:
+        """
+        Ouvre le client HTTP partagé (connexions keep-alive réutilisées entre les appels).
+        
+        À appeler au démarrage de l'application, dans la boucle d'événements qui sert les requêtes.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10)
+            )
+    
+    async def close(self) -> None:
+        """Ferme le client HTTP partagé."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
     
     async def get_predictions(
         self,
@@ -65,14 +84,18 @@ class MLServiceClient:
             headers['Authorization'] = f'Bearer {self.api_key}'
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, params=params, headers=headers)
-                response.raise_for_status()
-                data = response.json()
-                
-                # Extraire les prédictions
-                predictions = data.get('predictions', [])
-                return predictions
+            if self._client is not None:
+                response = await self._client.get(url, params=params, headers=headers)
+            else:
+                # Client non démarré (ex: hors lifespan) : connexion ponctuelle
+                async with httpx.AsyncClient(timeout=self.timeout) as client:
+                    response = await client.get(url, params=params, headers=headers)
+            response.raise_for_status()
+            data = response.json()
+            
+            # Extraire les prédictions
+            predictions = data.get('predictions', [])
+            return predictions
         
         except httpx.HTTPError as e:
             # En cas d'erreur, retourner des données mockées pour le développement
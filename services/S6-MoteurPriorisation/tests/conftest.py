@@ -0,0 +1,15 @@
+"""
+Fixtures partagées par les tests
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Client de test unique pour toute la session (lifespan exécuté une seule fois)"""
+    # Import différé : seuls les tests qui utilisent le client chargent l'application
+    from src.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
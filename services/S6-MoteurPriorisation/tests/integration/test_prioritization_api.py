@@ -2,16 +2,12 @@
 Tests d'intégration pour l'API de priorisation
 """
 import pytest
-from fastapi.testclient import TestClient
-from src.main import app
-
-client = TestClient(app)
 
 
 class TestPrioritizationAPI:
     """Tests d'intégration pour l'API de priorisation"""
     
-    def test_prioritize_maximize_popt20(self):
+    def test_prioritize_maximize_popt20(self, client):
         """Test priorisation avec stratégie maximize_popt20"""
         request = {
             "repository_id": "repo_12345",
@@ -34,7 +30,7 @@ class TestPrioritizationAPI:
         priorities = [c['priority'] for c in data['prioritized_plan']]
         assert priorities == sorted(priorities)
     
-    def test_prioritize_top_k_coverage(self):
+    def test_prioritize_top_k_coverage(self, client):
         """Test priorisation avec stratégie top_k_coverage"""
         request = {
             "repository_id": "repo_12345",
@@ -53,7 +49,7 @@ class TestPrioritizationAPI:
         
         assert len(data['prioritized_plan']) == 2
     
-    def test_prioritize_budget_optimization(self):
+    def test_prioritize_budget_optimization(self, client):
         """Test priorisation avec stratégie budget_optimization"""
         request = {
             "repository_id": "repo_12345",
@@ -74,7 +70,7 @@ class TestPrioritizationAPI:
         total_effort = data['metrics']['total_effort_hours']
         assert total_effort <= 5.0
     
-    def test_prioritize_coverage_optimization(self):
+    def test_prioritize_coverage_optimization(self, client):
         """Test priorisation avec stratégie coverage_optimization"""
         request = {
             "repository_id": "repo_12345",
@@ -93,7 +89,7 @@ class TestPrioritizationAPI:
         
         assert len(data['prioritized_plan']) > 0
     
-    def test_prioritize_multi_objective(self):
+    def test_prioritize_multi_objective(self, client):
         """Test priorisation avec stratégie multi_objective"""
         request = {
             "repository_id": "repo_12345",
@@ -115,7 +111,7 @@ class TestPrioritizationAPI:
         total_effort = data['metrics']['total_effort_hours']
         assert total_effort <= 6.0
     
-    def test_prioritize_invalid_repository(self):
+    def test_prioritize_invalid_repository(self, client):
         """Test avec repository invalide (devrait utiliser mock)"""
         request = {
             "repository_id": "invalid_repo"
@@ -129,7 +125,7 @@ class TestPrioritizationAPI:
         # Devrait fonctionner avec les données mockées
         assert response.status_code in [200, 404]
     
-    def test_get_prioritization(self):
+    def test_get_prioritization(self, client):
         """Test récupération plan priorisé"""
         response = client.get(
             "/api/v1/prioritize/repo_12345?strategy=maximize_popt20"
@@ -141,7 +137,7 @@ class TestPrioritizationAPI:
         assert 'prioritized_plan' in data
         assert 'metrics' in data
     
-    def test_prioritize_response_structure(self):
+    def test_prioritize_response_structure(self, client):
         """Test structure de la réponse"""
         request = {
             "repository_id": "repo_12345"
@@ -2,12 +2,8 @@
 Tests unitaires pour le health check
 """
 import pytest
-from fastapi.testclient import TestClient
-from src.main import app
 
-client = TestClient(app)
-
-def test_health_check():
+def test_health_check(client):
     """Test du health check endpoint"""
     response = client.get("/health")
     assert response.status_code == 200
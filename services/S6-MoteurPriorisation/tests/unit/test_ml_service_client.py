@@ -0,0 +1,72 @@
+"""
+Tests unitaires pour MLServiceClient (client HTTP partagé)
+"""
+import httpx
+import pytest
+from src.services.ml_service_client import MLServiceClient
+
+
+PREDICTIONS = [{'class_name': 'com.example.Foo', 'risk_score': 0.5, 'loc': 10, 'cyclomatic_complexity': 2}]
+
+
+@pytest.fixture
+def created_clients(monkeypatch):
+    """Remplace httpx.AsyncClient par un client sur MockTransport et trace les instances créées"""
+    real_async_client = httpx.AsyncClient
+    clients = []
+
+    def handler(request):
+        assert request.url.path == "/api/v1/predictions"
+        assert request.url.params["repository_id"] == "repo_1"
+        return httpx.Response(200, json={'predictions': PREDICTIONS})
+
+    def factory(*args, **kwargs):
+        client = real_async_client(*args, transport=httpx.MockTransport(handler), **kwargs)
+        clients.append(client)
+        return client
+
+    monkeypatch.setattr(httpx, "AsyncClient", factory)
+    return clients
+
+
+@pytest.mark.asyncio
+async def test_get_predictions_reuses_started_client(created_clients):
+    """Après start(), tous les appels passent par le même client"""
+    ml_client = MLServiceClient(base_url="http://ml-service")
+    await ml_client.start()
+    await ml_client.start()
+
+    assert await ml_client.get_predictions("repo_1") == PREDICTIONS
+    assert await ml_client.get_predictions("repo_1") == PREDICTIONS
+
+    assert len(created_clients) == 1
+    assert ml_client._client is created_clients[0]
+
+    await ml_client.close()
+
+
+@pytest.mark.asyncio
+async def test_get_predictions_without_start_uses_per_call_client(created_clients):
+    """Sans start(), chaque appel ouvre et ferme son propre client"""
+    ml_client = MLServiceClient(base_url="http://ml-service")
+
+    assert await ml_client.get_predictions("repo_1") == PREDICTIONS
+    assert await ml_client.get_predictions("repo_1") == PREDICTIONS
+
+    assert len(created_clients) == 2
+    assert all(client.is_closed for client in created_clients)
+    assert ml_client._client is None
+
+
+@pytest.mark.asyncio
+async def test_close_resets_client(created_clients):
+    """close() ferme le client partagé et peut être rappelé sans erreur"""
+    ml_client = MLServiceClient(base_url="http://ml-service")
+    await ml_client.start()
+    shared_client = ml_client._client
+
+    await ml_client.close()
+    await ml_client.close()
+
+    assert ml_client._client is None
+    assert shared_client.is_closed
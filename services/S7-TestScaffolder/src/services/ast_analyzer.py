@@ -24,6 +24,15 @@ import re
 #        JAVA_LANGUAGE = None
 JAVA_LANGUAGE = None
 
+# Expressions régulières du parser basique, compilées une seule fois au chargement
+PACKAGE_RE = re.compile(r'package\s+([\w.]+);')
+CLASS_DECLARATION_RE = re.compile(r'(?:public\s+)?(?:abstract\s+)?(?:final\s+)?(?:class|interface|enum)\s+(\w+)')
+IMPORT_RE = re.compile(r'import\s+(?:static\s+)?([\w.*]+);')
+ANNOTATION_RE = re.compile(r'@(\w+)(?:\([^)]*\))?')
+METHOD_RE = re.compile(r'(?:@\w+(?:\([^)]*\))?\s+)*(?:public\s+)?(?:private\s+)?(?:protected\s+)?(?:static\s+)?(?:final\s+)?(?:[\w<>,\s\[\]]+\s+)?(\w+)\s*\(([^)]*)\)\s*(?:throws\s+([\w\s,]+))?\s*\{')
+PARAMETER_RE = re.compile(r'([\w<>,\s\[\]]+)\s+(\w+)')
+FIELD_RE = re.compile(r'(?:@\w+(?:\([^)]*\))?\s+)*(?:public\s+)?(?:private\s+)?(?:protected\s+)?(?:static\s+)?(?:final\s+)?([\w<>,\s\[\]]+)\s+(\w+)(?:\s*=\s*[^;]+)?;')
+
 
 class ASTAnalyzer:
     """
@@ -338,12 +347,12 @@ class ASTAnalyzer:
         }
         
         # Extraire le package
-        package_match = re.search(r'package\s+([\w.]+);', java_code)
+        package_match = PACKAGE_RE.search(java_code)
         if package_match:
             result['package_name'] = package_match.group(1)
         
         # Extraire le nom de classe et ses modificateurs
-        class_match = re.search(r'(?:public\s+)?(?:abstract\s+)?(?:final\s+)?(?:class|interface|enum)\s+(\w+)', java_code)
+        class_match = CLASS_DECLARATION_RE.search(java_code)
         if class_match:
             result['class_name'] = class_match.group(1)
             class_decl = java_code[:class_match.end()]
@@ -352,16 +361,15 @@ class ASTAnalyzer:
             result['is_enum'] = 'enum' in class_decl
         
         # Extraire les imports
-        import_matches = re.findall(r'import\s+(?:static\s+)?([\w.*]+);', java_code)
+        import_matches = IMPORT_RE.findall(java_code)
         result['imports'] = import_matches
         
         # Extraire les annotations de classe
-        class_annotations = re.findall(r'@(\w+)(?:\([^)]*\))?', java_code.split('class')[0] if 'class' in java_code else '')
+        class_annotations = ANNOTATION_RE.findall(java_code.split('class')[0] if 'class' in java_code else '')
         result['annotations'] = [f'@{ann}' for ann in class_annotations]
         
         # Extraire les méthodes publiques avec plus de détails
-        method_pattern = r'(?:@\w+(?:\([^)]*\))?\s+)*(?:public\s+)?(?:private\s+)?(?:protected\s+)?(?:static\s+)?(?:final\s+)?(?:[\w<>,\s\[\]]+\s+)?(\w+)\s*\(([^)]*)\)\s*(?:throws\s+([\w\s,]+))?\s*\{'
-        method_matches = re.finditer(method_pattern, java_code)
+        method_matches = METHOD_RE.finditer(java_code)
         for match in method_matches:
             method_name = match.group(1)
             params_str = match.group(2) if match.group(2) else ''
@@ -380,7 +388,7 @@ class ASTAnalyzer:
                 if params_str.strip():
                     param_parts = [p.strip() for p in params_str.split(',')]
                     for param in param_parts:
-                        param_match = re.match(r'([\w<>,\s\[\]]+)\s+(\w+)', param)
+                        param_match = PARAMETER_RE.match(param)
                         if param_match:
                             param_type = param_match.group(1).strip()
                             param_name = param_match.group(2).strip()
@@ -395,7 +403,7 @@ class ASTAnalyzer:
                 exceptions = [e.strip() for e in throws_str.split(',')] if throws_str else []
                 
                 # Extraire les annotations
-                method_annotations = re.findall(r'@(\w+)(?:\([^)]*\))?', before_method)
+                method_annotations = ANNOTATION_RE.findall(before_method)
                 
                 result['methods'].append({
                     'name': method_name,
@@ -420,7 +428,7 @@ class ASTAnalyzer:
             if params_str.strip():
                 param_parts = [p.strip() for p in params_str.split(',')]
                 for param in param_parts:
-                    param_match = re.match(r'([\w<>,\s\[\]]+)\s+(\w+)', param)
+                    param_match = PARAMETER_RE.match(param)
                     if param_match:
                         param_type = param_match.group(1).strip()
                         param_name = param_match.group(2).strip()
@@ -431,7 +439,7 @@ class ASTAnalyzer:
                             'is_collection': False
                         })
             
-            constructor_annotations = re.findall(r'@(\w+)(?:\([^)]*\))?', before_constructor)
+            constructor_annotations = ANNOTATION_RE.findall(before_constructor)
             
             result['constructors'].append({
                 'parameters': parameters,
@@ -440,15 +448,14 @@ class ASTAnalyzer:
             })
         
         # Extraire les champs
-        field_pattern = r'(?:@\w+(?:\([^)]*\))?\s+)*(?:public\s+)?(?:private\s+)?(?:protected\s+)?(?:static\s+)?(?:final\s+)?([\w<>,\s\[\]]+)\s+(\w+)(?:\s*=\s*[^;]+)?;'
-        field_matches = re.finditer(field_pattern, java_code)
+        field_matches = FIELD_RE.finditer(java_code)
         for match in field_matches:
             field_type = match.group(1).strip()
             field_name = match.group(2).strip()
             field_start = match.start()
             before_field = java_code[max(0, field_start-50):field_start]
             
-            field_annotations = re.findall(r'@(\w+)(?:\([^)]*\))?', before_field)
+            field_annotations = ANNOTATION_RE.findall(before_field)
             
             result['fields'].append({
                 'name': field_name,
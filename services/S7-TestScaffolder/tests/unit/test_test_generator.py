@@ -12,13 +12,13 @@ FIXTURES_DIR = Path(__file__).parent.parent / "fixtures"
 SAMPLE_JAVA_FILE = FIXTURES_DIR / "sample_java_class.java"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def test_generator():
     """Fixture pour créer un générateur de tests"""
     return TestGenerator()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_java_code():
     """Fixture pour charger le code Java de test"""
     if SAMPLE_JAVA_FILE.exists():
@@ -40,7 +40,7 @@ public class UserService {
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_class_analysis(sample_java_code):
     """Fixture pour créer une analyse de classe"""
     analyzer = ASTAnalyzer()